@@ -28,10 +28,12 @@ The main entry point for exploration is the Jupyter notebook under
 from .utilities import (
     clean_product_name,
     clean_product_names,
+    clean_product_names_parallel,
     flatten_list,
     unique_preserve_order,
     python_stats,
     numpy_stats,
+    batch_stats,
     compare_python_numpy_stats,
 )
 
@@ -40,10 +42,12 @@ from .menu import run_menu
 __all__ = [
     "clean_product_name",
     "clean_product_names",
+    "clean_product_names_parallel",
     "flatten_list",
     "unique_preserve_order",
     "python_stats",
     "numpy_stats",
+    "batch_stats",
     "compare_python_numpy_stats",
     "run_menu",
 ]
@@ -21,7 +21,8 @@ The goal is not to build a full CLI application, but to:
 - Provide a slightly more interactive experience in the notebook.
 """
 
-from typing import List
+import array
+import warnings
 
 from .utilities import (
     clean_product_name,
@@ -30,6 +31,12 @@ from .utilities import (
     format_comparison,
 )
 
+# Inputs at least this long (about 10,000 numbers) are parsed with
+# np.fromstring first. It is only ~1.3-1.5x faster on large inputs and
+# several times slower on short, typical menu input, where the plain loop
+# is used.
+_FROMSTRING_MIN_LENGTH = 100_000
+
 
 def _prompt(msg: str) -> str:
     """Wrapper around ``input`` for easier testing/patching.
@@ -41,19 +48,47 @@ def _prompt(msg: str) -> str:
     return input(msg)
 
 
-def _parse_numbers(raw: str) -> List[float]:
-    """Parse a comma- or space-separated string of numbers into a list.
+def _parse_numbers(raw: str) -> array.array:
+    """Parse a comma- or space-separated string of numbers into an array.
+
+    The numbers are returned as an ``array.array`` of C doubles (typecode
+    ``"d"``). It stores 8 bytes per number instead of a boxed Python float,
+    and NumPy can wrap its buffer without copying.
 
     Examples
     --------
-    ``"1, 2, 3"`` -> ``[1.0, 2.0, 3.0]``
+    ``"1, 2, 3"`` -> ``array('d', [1.0, 2.0, 3.0])``
 
-    ``"10 20 30"`` -> ``[10.0, 20.0, 30.0]``
+    ``"10 20 30"`` -> ``array('d', [10.0, 20.0, 30.0])``
     """
 
-    # Replace commas with spaces, then split on whitespace
-    pieces = raw.replace(",", " ").split()
-    numbers: List[float] = []
+    # Replace commas with spaces
+    cleaned = raw.replace(",", " ").strip()
+    numbers = array.array("d")
+
+    # Fast path for very long input: let NumPy parse the whole string in one
+    # C-level call. The input is stripped, so it is never blank here (which
+    # np.fromstring would parse as [-1.0]). Older NumPy versions only warn
+    # (and return partial data) on bad input, so that warning is an error.
+    if len(cleaned) >= _FROMSTRING_MIN_LENGTH:
+        # Imported here so that loading the menu does not import NumPy
+        import numpy as np
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                arr = np.fromstring(cleaned, sep=" ", dtype=np.float64)
+        except (ValueError, DeprecationWarning):
+            pass
+        else:
+            # Copy the parsed doubles straight from the array buffer, without
+            # an intermediate bytes object
+            numbers.frombytes(memoryview(arr).cast("B"))
+            return numbers
+
+    # Convert token by token; this also reports exactly which token is
+    # invalid (and accepts anything ``float`` accepts, e.g. "1_000")
+    pieces = cleaned.split()
     for p in pieces:
         if not p:
             continue
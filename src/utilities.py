@@ -18,21 +18,61 @@ The goal is clarity, not maximum performance.
 """
 
 from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import chain
+import math
 import re
 import time
-from typing import Iterable, List, Sequence, Tuple, Dict, Any, Optional
-
-import numpy as np
+import timeit
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+# NumPy is imported inside the functions that need it, so that importing
+# this module (e.g. just for the string helpers) does not pay NumPy's
+# import cost. Python caches the module after the first import.
+if TYPE_CHECKING:
+    import numpy as np
 
 
 # ---------------------------------------------------------------------------
 # String utilities
 # ---------------------------------------------------------------------------
 
-_clean_pattern = re.compile(r"[^a-z0-9]+")
 
+@lru_cache(maxsize=64)
+def _compiled(pattern: str, flags: int = 0) -> "re.Pattern[str]":
+    """Compile *pattern* once and reuse the result on later calls.
+
+    Used for custom cleaning patterns so that each call does not pay for
+    :func:`re.compile` again.
+    """
+
+    return re.compile(pattern, flags)
+
+
+_clean_pattern = _compiled(r"[^a-z0-9]+")
 
-def clean_product_name(name: str) -> str:
+# 256-byte translation table doing the lowercase + ``_clean_pattern`` steps
+# for ASCII text in one go: letters are lowercased, digits are kept and
+# every other byte becomes a space.
+_ascii_clean_table = bytes(
+    ord(c.lower()) if c.isascii() and c.isalnum() else ord(" ")
+    for c in map(chr, range(256))
+)
+
+
+def clean_product_name(name: str, pattern: Optional[str] = None) -> str:
     """Clean a single product name.
 
     Steps:
@@ -40,13 +80,16 @@ def clean_product_name(name: str) -> str:
     1. Convert to string (in case the value is not already a string).
     2. Strip leading and trailing whitespace.
     3. Convert to lowercase.
-    4. Replace any **non-alphanumeric characters** with a single space.
-    5. Collapse multiple spaces into a single space.
+    4. Replace every run of **non-alphanumeric characters** (including
+       whitespace) with a single space.
 
     Parameters
     ----------
     name:
         The original product name (any object; will be converted to ``str``).
+    pattern:
+        Optional regular expression matching the text to replace with a
+        space in step 4. Defaults to ``[^a-z0-9]+``.
 
     Returns
     -------
@@ -57,23 +100,33 @@ def clean_product_name(name: str) -> str:
     # Convert to string in a safe way
     text = str(name)
 
+    # Fast path for plain ASCII text with the default pattern: a single
+    # bytes.translate lowercases and blanks out unwanted characters, then
+    # split/join collapses (and strips) the spaces. Everything runs in C
+    # without the regex engine.
+    if pattern is None and text.isascii():
+        cleaned = text.encode("ascii").translate(_ascii_clean_table)
+        return b" ".join(cleaned.split()).decode("ascii")
+
     # Step 1: strip whitespace
     text = text.strip()
 
     # Step 2: lowercase
     text = text.lower()
 
-    # Step 3: replace non-alphanumeric characters with a space
-    text = _clean_pattern.sub(" ", text)
-
-    # Step 4: collapse multiple spaces into a single space
-    text = re.sub(r"\s+", " ", text)
+    # Step 3: replace each run of non-alphanumeric characters with a single
+    # space. Whitespace is non-alphanumeric too, so this also collapses
+    # repeated spaces in the same pass.
+    regex = _clean_pattern if pattern is None else _compiled(pattern)
+    text = regex.sub(" ", text)
 
     # Final strip to remove any leftover leading/trailing space
     return text.strip()
 
 
-def clean_product_names(names: Iterable[Any]) -> List[str]:
+def clean_product_names(
+    names: Iterable[Any], pattern: Optional[str] = None
+) -> List[str]:
     """Clean a sequence of product names.
 
     This simply applies :func:`clean_product_name` to every element in
@@ -83,6 +136,8 @@ def clean_product_names(names: Iterable[Any]) -> List[str]:
     ----------
     names:
         Any iterable of values that can be converted to strings.
+    pattern:
+        Optional cleaning pattern, see :func:`clean_product_name`.
 
     Returns
     -------
@@ -90,7 +145,78 @@ def clean_product_names(names: Iterable[Any]) -> List[str]:
         Cleaned product names.
     """
 
-    return [clean_product_name(name) for name in names]
+    return [clean_product_name(name, pattern) for name in names]
+
+
+# Below this many names clean_product_names_parallel cleans in-process, since
+# starting workers and pickling the data would cost more than it saves.
+_PARALLEL_THRESHOLD = 100_000
+
+
+def _chunks(items: List[Any], size: int) -> Iterator[List[Any]]:
+    """Yield consecutive slices of *items* with at most *size* elements."""
+
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _clean_chunk(chunk: List[str], pattern: Optional[str] = None) -> List[str]:
+    """Clean one chunk of names in a worker process.
+
+    Defined at module level so that it (and a :func:`functools.partial` of
+    it) can be pickled by :class:`~concurrent.futures.ProcessPoolExecutor`.
+    """
+
+    return clean_product_names(chunk, pattern)
+
+
+def clean_product_names_parallel(
+    names: Iterable[Any],
+    pattern: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunksize: int = 10_000,
+) -> List[str]:
+    """Clean a large batch of product names using several processes.
+
+    The names are split into contiguous chunks of *chunksize* names, each
+    chunk is cleaned with :func:`clean_product_names` in a worker process,
+    and the results are returned in the original order. Batches smaller
+    than 100,000 names are cleaned in the current process instead.
+
+    Parameters
+    ----------
+    names:
+        Any iterable of values that can be converted to strings.
+    pattern:
+        Optional cleaning pattern, see :func:`clean_product_name`.
+    workers:
+        Maximum number of worker processes. Defaults to the number of CPUs.
+    chunksize:
+        Number of names sent to a worker at a time.
+
+    Returns
+    -------
+    list of str
+        Cleaned product names.
+    """
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+
+    # Convert to str up front so that every chunk can be pickled cheaply
+    texts = [str(name) for name in names]
+
+    if len(texts) < _PARALLEL_THRESHOLD:
+        return clean_product_names(texts, pattern)
+
+    # Imported here because it pulls in multiprocessing, which most users of
+    # this module never need
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        clean_chunk = partial(_clean_chunk, pattern=pattern)
+        cleaned_chunks = executor.map(clean_chunk, _chunks(texts, chunksize))
+        return list(chain.from_iterable(cleaned_chunks))
 
 
 # ---------------------------------------------------------------------------
@@ -121,11 +247,7 @@ def flatten_list(nested: Iterable[Iterable[Any]]) -> List[Any]:
         A flat list containing all elements of the nested input.
     """
 
-    flat: List[Any] = []
-    for sub in nested:
-        for item in sub:
-            flat.append(item)
-    return flat
+    return list(chain.from_iterable(nested))
 
 
 def unique_preserve_order(items: Iterable[Any]) -> List[Any]:
@@ -134,7 +256,7 @@ def unique_preserve_order(items: Iterable[Any]) -> List[Any]:
     Parameters
     ----------
     items:
-        Any iterable.
+        Any iterable of hashable items.
 
     Returns
     -------
@@ -142,13 +264,9 @@ def unique_preserve_order(items: Iterable[Any]) -> List[Any]:
         A list of unique items in the order they first appeared.
     """
 
-    seen = set()
-    result: List[Any] = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    # Dictionaries keep insertion order, so the keys are the unique items
+    # in first-seen order
+    return list(dict.fromkeys(items))
 
 
 # ---------------------------------------------------------------------------
@@ -156,33 +274,7 @@ def unique_preserve_order(items: Iterable[Any]) -> List[Any]:
 # ---------------------------------------------------------------------------
 
 
-def _validate_numeric_sequence(values: Sequence[float]) -> None:
-    """Basic validation that *values* looks like a numeric sequence.
-
-    This is intentionally minimal. It checks that:
-
-    - ``values`` is not empty
-    - Every element can be converted to ``float``
-
-    Raises
-    ------
-    ValueError
-        If the sequence is empty or if an element cannot be converted to
-        a float.
-    """
-
-    if not values:
-        raise ValueError("values must be a non-empty sequence")
-
-    # Attempt float conversion; fail fast on error
-    for v in values:
-        try:
-            float(v)
-        except (TypeError, ValueError) as exc:  # pragma: no cover - defensive
-            raise ValueError(f"Non-numeric value encountered: {v!r}") from exc
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatsResult:
     """Container for basic descriptive statistics.
 
@@ -211,7 +303,7 @@ class StatsResult:
 
 
 def python_stats(values: Sequence[float]) -> StatsResult:
-    """Compute basic statistics using **pure Python** loops.
+    """Compute basic statistics using **pure Python** built-ins.
 
     The function calculates:
 
@@ -221,6 +313,11 @@ def python_stats(values: Sequence[float]) -> StatsResult:
     - minimum
     - maximum
 
+    Each statistic is computed with a built-in (``len``, ``math.fsum``,
+    ``min``, ``max``) so the per-element work runs in C rather than in a
+    hand-written Python loop. ``math.fsum`` also gives a correctly rounded
+    total.
+
     Parameters
     ----------
     values:
@@ -230,29 +327,68 @@ def python_stats(values: Sequence[float]) -> StatsResult:
     -------
     StatsResult
         A dataclass instance with the computed statistics.
+
+    Raises
+    ------
+    ValueError
+        If the sequence is empty or if an element cannot be converted to
+        a float.
     """
 
-    _validate_numeric_sequence(values)
+    # Convert every element to float once; this doubles as validation and
+    # also materializes iterators
+    floats = _float_list(values)
 
-    # Initialize with the first element
-    iterator = iter(values)
-    first = float(next(iterator))
+    if not floats:
+        raise ValueError("values must be a non-empty sequence")
 
-    count = 1
-    total = first
-    minimum = first
-    maximum = first
+    return _python_stats_from_floats(floats)
 
-    # Loop over remaining values
-    for v in iterator:
-        x = float(v)
-        count += 1
-        total += x
-        if x < minimum:
-            minimum = x
-        if x > maximum:
-            maximum = x
 
+def _float_list(values: Iterable[Any]) -> List[float]:
+    """Convert every element of *values* to ``float``.
+
+    Raises
+    ------
+    ValueError
+        If *values* is not iterable or an element cannot be converted to
+        a float. The message names the first offending element.
+    """
+
+    try:
+        items = values if isinstance(values, list) else list(values)
+    except TypeError as exc:
+        raise ValueError(
+            f"values must be a sequence of numbers, not {type(values).__name__}"
+        ) from exc
+
+    try:
+        return list(map(float, items))
+    except (TypeError, ValueError):
+        pass
+
+    # map() does not say which element failed, so look for it to report it
+    for v in items:
+        try:
+            float(v)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Non-numeric value encountered: {v!r}") from exc
+
+    raise ValueError("Non-numeric value encountered")  # pragma: no cover - defensive
+
+
+def _python_stats_from_floats(floats: List[float]) -> StatsResult:
+    """Core of :func:`python_stats` for an already validated list of floats."""
+
+    count = len(floats)
+    try:
+        total = math.fsum(floats)
+    except (OverflowError, ValueError):
+        # fsum raises on intermediate overflow (e.g. 1e308 + 1e308) and on
+        # inf + -inf, where plain summation gives inf / nan instead
+        total = sum(floats)
+    minimum = min(floats)
+    maximum = max(floats)
     mean = total / count
 
     return StatsResult(
@@ -270,11 +406,49 @@ def python_stats(values: Sequence[float]) -> StatsResult:
 # ---------------------------------------------------------------------------
 
 
-def numpy_stats(values: Sequence[float]) -> StatsResult:
+# Number of elements (512 KiB of float64) reduced at a time by
+# ``_sum_min_max``, small enough to stay resident in a typical L2 cache.
+_REDUCTION_BLOCK = 1 << 16
+
+
+def _sum_min_max(arr: np.ndarray) -> Tuple[float, float, float]:
+    """Return ``(total, minimum, maximum)`` of a non-empty array.
+
+    Large arrays are processed block by block so that the sum, min and max
+    reductions all read each block while it is still in cache, instead of
+    streaming the whole array from memory three times.
+
+    The total is always accumulated in ``float64``, even for ``float32``
+    input, so summing many low-precision values does not lose accuracy.
+    """
+
+    import numpy as np
+
+    flat = arr.ravel()
+
+    if flat.size <= _REDUCTION_BLOCK:
+        return float(flat.sum(dtype=np.float64)), float(flat.min()), float(flat.max())
+
+    first = flat[:_REDUCTION_BLOCK]
+    total = first.sum(dtype=np.float64)
+    minimum = first.min()
+    maximum = first.max()
+
+    for start in range(_REDUCTION_BLOCK, flat.size, _REDUCTION_BLOCK):
+        block = flat[start:start + _REDUCTION_BLOCK]
+        total += block.sum(dtype=np.float64)
+        # np.minimum / np.maximum propagate NaN just like arr.min() / arr.max()
+        minimum = np.minimum(minimum, block.min())
+        maximum = np.maximum(maximum, block.max())
+
+    return float(total), float(minimum), float(maximum)
+
+
+def numpy_stats(values: Sequence[float], dtype: Any = "float64") -> StatsResult:
     """Compute basic statistics using **NumPy**.
 
-    This converts the input sequence to a NumPy array of ``float64`` and
-    then uses NumPy's vectorized functions to compute:
+    This converts the input sequence to a NumPy array of ``float64`` (or
+    *dtype*) and then uses NumPy's vectorized functions to compute:
 
     - count
     - sum (total)
@@ -286,22 +460,104 @@ def numpy_stats(values: Sequence[float]) -> StatsResult:
     ----------
     values:
         A non-empty sequence of numeric values.
+    dtype:
+        Floating-point type used to store the values. ``"float32"`` halves
+        the memory traffic for large inputs at the cost of precision in the
+        stored values; the total is still accumulated in ``float64``.
 
     Returns
     -------
     StatsResult
         A dataclass instance with the computed statistics.
+
+    Raises
+    ------
+    ValueError
+        If the sequence is empty, is not one-dimensional, or cannot be
+        converted to floats.
     """
 
-    _validate_numeric_sequence(values)
+    return _numpy_stats_from_array(_as_float_array(values, dtype))
+
+
+def _float_dtype(dtype: Any) -> np.dtype:
+    """Return *dtype* as a NumPy dtype, checking that it is floating-point."""
+
+    import numpy as np
+
+    result = np.dtype(dtype)
+    if result.kind != "f":
+        raise ValueError(f"dtype must be a floating-point type, got {result}")
+    return result
+
+
+def _to_float_array(values: Any, dtype: Any, ndim: int) -> np.ndarray:
+    """Convert *values* to an *ndim*-dimensional floating-point array.
+
+    Shared by :func:`numpy_stats` and :func:`batch_stats`. Real numeric
+    input is cast directly by NumPy. Everything else (objects such as
+    ``None``, strings, complex numbers, dates) would be cast with NaN,
+    dropped imaginary parts or epoch offsets, so those elements are
+    converted with ``float`` exactly as :func:`python_stats` does.
+
+    Raises
+    ------
+    ValueError
+        If the input does not have *ndim* dimensions or an element cannot
+        be converted to a float.
+    """
+
+    import numpy as np
+
+    dtype = _float_dtype(dtype)
+    shape_error = f"values must be a {ndim}-D sequence of numbers"
+
+    try:
+        arr = np.asarray(values)
+    except (TypeError, ValueError) as exc:
+        # e.g. nested lists of different lengths
+        raise ValueError(shape_error) from exc
+
+    if arr.ndim != ndim:
+        raise ValueError(f"{shape_error}, got {arr.ndim} dimension(s)")
+
+    if arr.dtype.kind in "biuf":
+        return arr.astype(dtype, copy=False)
+
+    floats = _float_list(arr.ravel().tolist())
+    return np.array(floats, dtype=dtype).reshape(arr.shape)
+
+
+def _as_float_array(values: Sequence[float], dtype: Any = "float64") -> np.ndarray:
+    """Convert *values* to a non-empty, one-dimensional float array.
+
+    NumPy's own conversion doubles as validation, so the input is only
+    walked once. The checks match :func:`python_stats`: ``None`` and other
+    values that ``float`` rejects raise, and so do scalars and nested
+    sequences.
+
+    Raises
+    ------
+    ValueError
+        If the sequence is empty, is not one-dimensional, or cannot be
+        converted to floats.
+    """
+
+    arr = _to_float_array(values, dtype, ndim=1)
+
+    if arr.size == 0:
+        raise ValueError("values must be a non-empty sequence")
+
+    return arr
+
 
-    arr = np.asarray(values, dtype="float64")
+def _numpy_stats_from_array(arr: np.ndarray) -> StatsResult:
+    """Core of :func:`numpy_stats` for an array from :func:`_as_float_array`."""
 
     count = int(arr.size)
-    total = float(arr.sum())
-    mean = float(arr.mean())
-    minimum = float(arr.min())
-    maximum = float(arr.max())
+    total, minimum, maximum = _sum_min_max(arr)
+    # Reuse the total instead of letting arr.mean() sum the array again
+    mean = total / count
 
     return StatsResult(
         count=count,
@@ -313,11 +569,61 @@ def numpy_stats(values: Sequence[float]) -> StatsResult:
     )
 
 
+def batch_stats(arr: np.ndarray, dtype: Any = "float64") -> Dict[str, np.ndarray]:
+    """Compute basic statistics for every row of a 2-D array at once.
+
+    Instead of calling :func:`numpy_stats` once per series (e.g. one price
+    series per product) and getting one :class:`StatsResult` each, this
+    runs each reduction a single time along ``axis=1`` and returns one
+    array per statistic.
+
+    Parameters
+    ----------
+    arr:
+        2-D array-like of numeric values, one series per row. Converted to
+        ``float64`` (or *dtype*).
+    dtype:
+        Floating-point type used to store the values, see
+        :func:`numpy_stats`. Totals and means are always ``float64``; the
+        minimum and maximum arrays use *dtype*.
+
+    Returns
+    -------
+    dict of str to numpy.ndarray
+        Arrays of length ``arr.shape[0]`` under the keys ``"count"``,
+        ``"total"``, ``"mean"``, ``"minimum"`` and ``"maximum"``.
+
+    Raises
+    ------
+    ValueError
+        If the input is not numeric, not 2-D, or has empty rows.
+    """
+
+    import numpy as np
+
+    data = _to_float_array(arr, dtype, ndim=2)
+
+    n_rows, n_cols = data.shape
+    if n_cols == 0:
+        raise ValueError("rows of arr must be non-empty")
+
+    total = data.sum(axis=1, dtype=np.float64)
+
+    return {
+        "count": np.full(n_rows, n_cols),
+        "total": total,
+        # Reuse the totals instead of summing again with data.mean(axis=1)
+        "mean": total / n_cols,
+        "minimum": data.min(axis=1),
+        "maximum": data.max(axis=1),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Comparison helper
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparisonResult:
     """Compare pure Python statistics with NumPy statistics.
 
@@ -331,9 +637,11 @@ class ComparisonResult:
         Boolean indicating whether the results match (within a small
         tolerance for floating-point comparisons).
     python_time:
-        Execution time in seconds for the pure Python implementation.
+        Execution time in seconds for the pure Python implementation
+        (averaged per call when benchmarking).
     numpy_time:
-        Execution time in seconds for the NumPy implementation.
+        Execution time in seconds for the NumPy implementation
+        (averaged per call when benchmarking).
     """
 
     python: StatsResult
@@ -350,45 +658,84 @@ def _stats_almost_equal(a: StatsResult, b: StatsResult, tol: float = 1e-9) -> bo
     are compared within the given absolute tolerance.
     """
 
-    if a.count != b.count:
-        return False
-
-    def close(x: float, y: float) -> bool:
-        return abs(x - y) <= tol
-
     return (
-        close(a.mean, b.mean)
-        and close(a.minimum, b.minimum)
-        and close(a.maximum, b.maximum)
-        and close(a.total, b.total)
+        a.count == b.count
+        and math.isclose(a.mean, b.mean, rel_tol=0.0, abs_tol=tol)
+        and math.isclose(a.minimum, b.minimum, rel_tol=0.0, abs_tol=tol)
+        and math.isclose(a.maximum, b.maximum, rel_tol=0.0, abs_tol=tol)
+        and math.isclose(a.total, b.total, rel_tol=0.0, abs_tol=tol)
     )
 
 
-def compare_python_numpy_stats(values: Sequence[float]) -> ComparisonResult:
+_T = TypeVar("_T")
+
+
+def _time_call(func: Callable[[], _T], benchmark: bool) -> Tuple[_T, float]:
+    """Run *func* and return its result with the time taken in seconds.
+
+    Without *benchmark* the function is timed once with
+    :func:`time.perf_counter`. With *benchmark* it is repeated via
+    :meth:`timeit.Timer.autorange` and the average time per call is
+    returned, which is far less noisy for very fast calls.
+    """
+
+    if benchmark:
+        number, elapsed = timeit.Timer(func).autorange()
+        return func(), elapsed / number
+
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def compare_python_numpy_stats(
+    values: Sequence[float], benchmark: bool = False
+) -> ComparisonResult:
     """Compute and compare statistics using both Python and NumPy.
 
     This helper is useful in the notebook for **demonstrating** that both
     implementations produce (almost) the same results, and for showing a
     very basic timing comparison.
 
+    *values* is validated and converted to a ``float64`` array only once;
+    that conversion is counted in the NumPy timing, while the Python
+    timing includes unboxing the array back into Python floats.
+
     Parameters
     ----------
     values:
         Sequence of numeric values.
+    benchmark:
+        If ``True``, time each implementation over many repeated calls
+        (see :meth:`timeit.Timer.autorange`) and report the average time
+        per call. By default each implementation runs once, which is
+        cheaper but very noisy for small inputs.
 
     Returns
     -------
     ComparisonResult
         Dataclass containing both results and timing information.
+
+    Raises
+    ------
+    ValueError
+        If the sequence is empty, is not one-dimensional, or cannot be
+        converted to floats (the same checks as :func:`python_stats`).
     """
 
-    start_py = time.perf_counter()
-    py_result = python_stats(values)
-    end_py = time.perf_counter()
+    def numpy_side() -> Tuple[np.ndarray, StatsResult]:
+        arr = _as_float_array(values)
+        return arr, _numpy_stats_from_array(arr)
 
-    start_np = time.perf_counter()
-    np_result = numpy_stats(values)
-    end_np = time.perf_counter()
+    # Convert once, inside the NumPy timing, then reuse the array for the
+    # pure Python side instead of converting *values* a second time
+    (arr, np_result), numpy_time = _time_call(numpy_side, benchmark)
+
+    # ndarray.tolist() unboxes to Python floats much faster than iterating
+    # over the array element by element
+    py_result, python_time = _time_call(
+        lambda: _python_stats_from_floats(arr.tolist()), benchmark
+    )
 
     are_equal = _stats_almost_equal(py_result, np_result)
 
@@ -396,8 +743,8 @@ def compare_python_numpy_stats(values: Sequence[float]) -> ComparisonResult:
         python=py_result,
         numpy=np_result,
         are_equal=are_equal,
-        python_time=end_py - start_py,
-        numpy_time=end_np - start_np,
+        python_time=python_time,
+        numpy_time=numpy_time,
     )
 
 
@@ -406,6 +753,19 @@ def compare_python_numpy_stats(values: Sequence[float]) -> ComparisonResult:
 # ---------------------------------------------------------------------------
 
 
+def _stats_lines(result: StatsResult) -> List[str]:
+    """Return the individual lines used by :func:`format_stats`."""
+
+    return [
+        f"Implementation: {result.impl}",
+        f"Count         : {result.count}",
+        f"Total         : {result.total:.6g}",
+        f"Mean          : {result.mean:.6g}",
+        f"Min           : {result.minimum:.6g}",
+        f"Max           : {result.maximum:.6g}",
+    ]
+
+
 def format_stats(result: StatsResult) -> str:
     """Return a nicely formatted multi-line string for a StatsResult.
 
@@ -420,14 +780,7 @@ def format_stats(result: StatsResult) -> str:
         Human-readable, multi-line description of the statistics.
     """
 
-    return (
-        f"Implementation: {result.impl}\n"
-        f"Count         : {result.count}\n"
-        f"Total         : {result.total:.6g}\n"
-        f"Mean          : {result.mean:.6g}\n"
-        f"Min           : {result.minimum:.6g}\n"
-        f"Max           : {result.maximum:.6g}"
-    )
+    return "\n".join(_stats_lines(result))
 
 
 def format_comparison(comp: ComparisonResult) -> str:
@@ -444,15 +797,17 @@ def format_comparison(comp: ComparisonResult) -> str:
         Multi-line comparison report.
     """
 
+    # Build one flat list of lines and join once at the end, rather than
+    # joining the already-joined output of format_stats a second time
     lines = [
         "=== Python implementation ===",
-        format_stats(comp.python),
+        *_stats_lines(comp.python),
         "",
         "=== NumPy implementation ===",
-        format_stats(comp.numpy),
+        *_stats_lines(comp.numpy),
         "",
         f"Results match (within tolerance): {comp.are_equal}",
-        f"Python time: {comp.python_time:.6f} s",
-        f"NumPy time : {comp.numpy_time:.6f} s",
+        f"Python time: {comp.python_time:.3g} s",
+        f"NumPy time : {comp.numpy_time:.3g} s",
     ]
     return "\n".join(lines)